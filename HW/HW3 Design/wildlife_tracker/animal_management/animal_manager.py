@@ -1,16 +1,16 @@
 from typing import Optional
 
-from wildlife_tracker.animal_managment.animal import Animal
+from wildlife_tracker.animal_management.animal import Animal
 
 class AnimalManager:
 
     def __init__(self) -> None:
-        animals: dict[int, Animal] = {}
+        self.animals: dict[int, Animal] = {}
 
     def get_animal_by_id(self, animal_id: int) -> Optional[Animal]:
         pass
 
-    def register_animal(self, Animal) -> None:
+    def register_animal(self, animal: Animal) -> None:
         pass
 
     def remove_animal(self, animal_id: int) -> None:
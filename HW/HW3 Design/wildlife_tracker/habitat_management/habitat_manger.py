@@ -1,5 +1,58 @@
-from typing import Optional, List
+from collections import defaultdict
+from typing import Any, Optional, List
+
+from wildlife_tracker.animal_management.animal import Animal
+from wildlife_tracker.habitat_management.habitat import Habitat
 
 class HabitatManager:
 
-    pass
+    def __init__(self) -> None:
+        self.habitats: dict[int, Habitat] = {}
+        # secondary indexes from attribute value to habitat ids, kept in step with self.habitats
+        self._by_area: defaultdict[str, set[int]] = defaultdict(set)
+        self._by_size: defaultdict[int, set[int]] = defaultdict(set)
+        self._by_type: defaultdict[str, set[int]] = defaultdict(set)
+
+    def assign_animals_to_habitat(self, habitat_id: int, animals: List[Animal]) -> None:
+        pass
+
+    def create_habitat(self, habitat_id: int, geographic_area: str, size: int, environment_type: str) -> Habitat:
+        if habitat_id in self.habitats:
+            raise ValueError(f"Habitat with ID {habitat_id} already exists")
+        habitat = Habitat(habitat_id, geographic_area, size, environment_type)
+        self.habitats[habitat_id] = habitat
+        self._by_area[geographic_area].add(habitat_id)
+        self._by_size[size].add(habitat_id)
+        self._by_type[environment_type].add(habitat_id)
+        return habitat
+
+    def get_habitat_by_id(self, habitat_id: int) -> Optional[Habitat]:
+        return self.habitats.get(habitat_id)
+
+    def get_habitats_by_geographic_area(self, geographic_area: str) -> List[Habitat]:
+        return [self.habitats[i] for i in self._by_area.get(geographic_area, ())]
+
+    def get_habitats_by_size(self, size: int) -> List[Habitat]:
+        return [self.habitats[i] for i in self._by_size.get(size, ())]
+
+    def get_habitats_by_type(self, environment_type: str) -> List[Habitat]:
+        return [self.habitats[i] for i in self._by_type.get(environment_type, ())]
+
+    def remove_habitat(self, habitat_id: int) -> None:
+        habitat = self.habitats.pop(habitat_id, None)
+        if habitat is None:
+            return
+        self._unindex(self._by_area, habitat.geographic_area, habitat_id)
+        self._unindex(self._by_size, habitat.size, habitat_id)
+        self._unindex(self._by_type, habitat.environment_type, habitat_id)
+
+    def update_habitat_details(self, habitat_id: int, **kwargs: Any) -> None:
+        pass
+
+    @staticmethod
+    def _unindex(index: defaultdict, key: Any, habitat_id: int) -> None:
+        # drop the key once its last habitat is gone so the index does not grow forever
+        habitat_ids = index[key]
+        habitat_ids.discard(habitat_id)
+        if not habitat_ids:
+            del index[key]
@@ -0,0 +1,63 @@
+import pytest
+
+from wildlife_tracker.habitat_management.habitat_manger import HabitatManager
+
+
+@pytest.fixture()
+def habitat_manager():
+    """Fixture to provide a new instance of HabitatManager for each test."""
+    manager = HabitatManager()
+    manager.create_habitat(1, 'Savanna', 100, 'grassland')
+    manager.create_habitat(2, 'Savanna', 50, 'wetland')
+    manager.create_habitat(3, 'Arctic', 100, 'tundra')
+    return manager
+
+
+def test_create_habitat(habitat_manager):
+    """Test that a created habitat is stored and can be found by ID."""
+    habitat = habitat_manager.create_habitat(4, 'Amazon', 75, 'rainforest')
+    assert habitat_manager.get_habitat_by_id(4) is habitat
+    assert habitat.geographic_area == 'Amazon'
+
+def test_create_habitat_duplicate_id(habitat_manager):
+    """Test error when creating a habitat with an ID that is already used, leaving the indexes untouched."""
+    with pytest.raises(ValueError, match="Habitat with ID 1 already exists"):
+        habitat_manager.create_habitat(1, 'Amazon', 75, 'rainforest')
+
+    assert habitat_manager.get_habitat_by_id(1).geographic_area == 'Savanna'
+    assert habitat_manager.get_habitats_by_geographic_area('Amazon') == []
+
+def test_get_habitats_by_index(habitat_manager):
+    """Test lookups by geographic area, size and environment type."""
+    assert sorted(h.habitat_id for h in habitat_manager.get_habitats_by_geographic_area('Savanna')) == [1, 2]
+    assert sorted(h.habitat_id for h in habitat_manager.get_habitats_by_size(100)) == [1, 3]
+    assert [h.habitat_id for h in habitat_manager.get_habitats_by_type('tundra')] == [3]
+
+def test_get_habitats_no_match(habitat_manager):
+    """Test that lookups with no matching habitat return an empty list."""
+    assert habitat_manager.get_habitats_by_geographic_area('Sahara') == []
+    assert habitat_manager.get_habitats_by_size(1) == []
+    assert habitat_manager.get_habitats_by_type('desert') == []
+
+def test_remove_habitat(habitat_manager):
+    """Test that a removed habitat disappears from every lookup and emptied index keys are dropped."""
+    habitat_manager.remove_habitat(3)
+
+    assert habitat_manager.get_habitat_by_id(3) is None
+    assert [h.habitat_id for h in habitat_manager.get_habitats_by_size(100)] == [1]
+    assert habitat_manager.get_habitats_by_geographic_area('Arctic') == []
+    assert 'Arctic' not in habitat_manager._by_area
+    assert 'tundra' not in habitat_manager._by_type
+
+def test_remove_habitat_then_recreate(habitat_manager):
+    """Test that a removed ID can be reused without stale index entries."""
+    habitat_manager.remove_habitat(1)
+    habitat_manager.create_habitat(1, 'Arctic', 10, 'tundra')
+
+    assert [h.habitat_id for h in habitat_manager.get_habitats_by_geographic_area('Savanna')] == [2]
+    assert sorted(h.habitat_id for h in habitat_manager.get_habitats_by_type('tundra')) == [1, 3]
+
+def test_remove_missing_habitat(habitat_manager):
+    """Test that removing an unknown habitat is a no-op."""
+    habitat_manager.remove_habitat(999)
+    assert len(habitat_manager.habitats) == 3
@@ -10,15 +10,25 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+# Difficulty penalty subtracted from the battle score
+DIFFICULTY_MODIFIER = {"HIGH": 1, "MED": 2, "LOW": 3}
+
+
 class BattleModel:
 
+    _MAX_COMBATANTS = 2
+    # battle() always pits combatants[0] against combatants[1]
+    _REQUIRED_COMBATANTS = 2
+
+    __slots__ = ('combatants',)
+
     def __init__(self):
         self.combatants: List[Meal] = []
 
     def battle(self) -> str:
         logger.info("Two meals enter, one meal leaves!")
 
-        if len(self.combatants) < 2:
+        if len(self.combatants) < self._REQUIRED_COMBATANTS:
             logger.error("Not enough combatants to start a battle.")
             raise ValueError("Two combatants must be prepped for a battle.")
 
@@ -73,14 +83,12 @@ class BattleModel:
         self.combatants.clear()
 
     def get_battle_score(self, combatant: Meal) -> float:
-        difficulty_modifier = {"HIGH": 1, "MED": 2, "LOW": 3}
-
         # Log the calculation process
         logger.info("Calculating battle score for %s: price=%.3f, cuisine=%s, difficulty=%s",
                     combatant.meal, combatant.price, combatant.cuisine, combatant.difficulty)
 
         # Calculate score
-        score = (combatant.price * len(combatant.cuisine)) - difficulty_modifier[combatant.difficulty]
+        score = (combatant.price * len(combatant.cuisine)) - DIFFICULTY_MODIFIER[combatant.difficulty]
 
         # Log the calculated score
         logger.info("Battle score for %s: %.3f", combatant.meal, score)
@@ -92,7 +100,7 @@ class BattleModel:
         return self.combatants
 
     def prep_combatant(self, combatant_data: Meal):
-        if len(self.combatants) >= 2:
+        if len(self.combatants) >= self._MAX_COMBATANTS:
             logger.error("Attempted to add combatant '%s' but combatants list is full", combatant_data.meal)
             raise ValueError("Combatant list is full, cannot add more combatants.")
 
@@ -1,8 +1,10 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
 import logging
 import os
 import sqlite3
-from typing import Any
+import threading
+from typing import Any, Callable
 
 from meal_max.utils.sql_utils import get_db_connection
 from meal_max.utils.logger import configure_logger
@@ -12,6 +14,21 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+VALID_DIFFICULTIES = frozenset(('LOW', 'MED', 'HIGH'))
+
+MEAL_CACHE_SIZE = 1024
+
+# Meals returned by get_meal_by_id / get_meal_by_name, keyed by ('id', meal_id)
+# or ('name', meal_name). A lookup only stores its result if clear_meal_cache()
+# did not bump the generation while it was reading the database.
+_meal_cache: dict[tuple[str, Any], 'Meal'] = {}
+_meal_cache_generation = 0
+_meal_cache_lock = threading.Lock()
+
+# Per-thread buffer of meal_id -> [battles, wins] deltas while inside batched_stats()
+_stats_buffer = threading.local()
+
+
 @dataclass
 class Meal:
     id: int
@@ -23,14 +40,14 @@ class Meal:
     def __post_init__(self):
         if self.price < 0:
             raise ValueError("Price must be a positive value.")
-        if self.difficulty not in ['LOW', 'MED', 'HIGH']:
+        if self.difficulty not in VALID_DIFFICULTIES:
             raise ValueError("Difficulty must be 'LOW', 'MED', or 'HIGH'.")
 
 
 def create_meal(meal: str, cuisine: str, price: float, difficulty: str) -> None:
     if not isinstance(price, (int, float)) or price <= 0:
         raise ValueError(f"Invalid price: {price}. Price must be a positive number.")
-    if difficulty not in ['LOW', 'MED', 'HIGH']:
+    if difficulty not in VALID_DIFFICULTIES:
         raise ValueError(f"Invalid difficulty level: {difficulty}. Must be 'LOW', 'MED', or 'HIGH'.")
 
     try:
@@ -66,6 +83,7 @@ def clear_meals() -> None:
             cursor = conn.cursor()
             cursor.executescript(create_table_script)
             conn.commit()
+            clear_meal_cache()
 
             logger.info("Meals cleared successfully.")
 
@@ -89,6 +107,7 @@ def delete_meal(meal_id: int) -> None:
 
             cursor.execute("UPDATE meals SET deleted = TRUE WHERE id = ?", (meal_id,))
             conn.commit()
+            clear_meal_cache()
 
             logger.info("Meal with ID %s marked as deleted.", meal_id)
 
@@ -116,9 +135,8 @@ def get_leaderboard(sort_by: str="wins") -> dict[str, Any]:
             cursor.execute(query)
             rows = cursor.fetchall()
 
-        leaderboard = []
-        for row in rows:
-            meal = {
+        leaderboard = [
+            {
                 'id': row[0],
                 'meal': row[1],
                 'cuisine': row[2],
@@ -128,7 +146,8 @@ def get_leaderboard(sort_by: str="wins") -> dict[str, Any]:
                 'wins': row[6],
                 'win_pct': round(row[7] * 100, 1)  # Convert to percentage
             }
-            leaderboard.append(meal)
+            for row in rows
+        ]
 
         logger.info("Leaderboard retrieved successfully")
         return leaderboard
@@ -137,7 +156,28 @@ def get_leaderboard(sort_by: str="wins") -> dict[str, Any]:
         logger.error("Database error: %s", str(e))
         raise e
 
-def get_meal_by_id(meal_id: int) -> Meal:
+def _cached_meal(key: tuple[str, Any], fetch: Callable[[], Meal]) -> Meal:
+    with _meal_cache_lock:
+        meal = _meal_cache.get(key)
+        generation = _meal_cache_generation
+    if meal is not None:
+        return meal
+
+    meal = fetch()
+
+    with _meal_cache_lock:
+        if generation == _meal_cache_generation:
+            if key not in _meal_cache and len(_meal_cache) >= MEAL_CACHE_SIZE:
+                del _meal_cache[next(iter(_meal_cache))]
+            _meal_cache[key] = meal
+    return meal
+
+def get_meal_by_id(meal_id: int, cache: bool = True) -> Meal:
+    if not cache:
+        return _fetch_meal_by_id(meal_id)
+    return _cached_meal(('id', meal_id), lambda: _fetch_meal_by_id(meal_id))
+
+def _fetch_meal_by_id(meal_id: int) -> Meal:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -158,7 +198,12 @@ def get_meal_by_id(meal_id: int) -> Meal:
         raise e
 
 
-def get_meal_by_name(meal_name: str) -> Meal:
+def get_meal_by_name(meal_name: str, cache: bool = True) -> Meal:
+    if not cache:
+        return _fetch_meal_by_name(meal_name)
+    return _cached_meal(('name', meal_name), lambda: _fetch_meal_by_name(meal_name))
+
+def _fetch_meal_by_name(meal_name: str) -> Meal:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -179,7 +224,24 @@ def get_meal_by_name(meal_name: str) -> Meal:
         raise e
 
 
+def clear_meal_cache() -> None:
+    """Drops every cached meal and discards lookups still reading the database."""
+    global _meal_cache_generation
+    with _meal_cache_lock:
+        _meal_cache_generation += 1
+        _meal_cache.clear()
+
+
 def update_meal_stats(meal_id: int, result: str) -> None:
+    pending = getattr(_stats_buffer, "pending", None)
+    if pending is not None:
+        if result not in ('win', 'loss'):
+            raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
+        deltas = pending.setdefault(meal_id, [0, 0])
+        deltas[0] += 1
+        deltas[1] += result == 'win'
+        return
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -205,3 +267,57 @@ def update_meal_stats(meal_id: int, result: str) -> None:
     except sqlite3.Error as e:
         logger.error("Database error: %s", str(e))
         raise e
+
+
+def flush_meal_stats() -> None:
+    """Writes the stats buffered by batched_stats() in a single transaction."""
+    pending = getattr(_stats_buffer, "pending", None)
+    if not pending:
+        return
+    deltas = list(pending.items())
+    pending.clear()
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            meal_ids = [meal_id for meal_id, _ in deltas]
+            placeholders = ", ".join("?" * len(meal_ids))
+            cursor.execute(f"SELECT id, deleted FROM meals WHERE id IN ({placeholders})", meal_ids)
+            deleted_by_id = dict(cursor.fetchall())
+
+            for meal_id in meal_ids:
+                if meal_id not in deleted_by_id:
+                    logger.info("Meal with ID %s not found", meal_id)
+                    raise ValueError(f"Meal with ID {meal_id} not found")
+                if deleted_by_id[meal_id]:
+                    logger.info("Meal with ID %s has been deleted", meal_id)
+                    raise ValueError(f"Meal with ID {meal_id} has been deleted")
+
+            cursor.executemany(
+                "UPDATE meals SET battles = battles + ?, wins = wins + ? WHERE id = ?",
+                [(battles, wins, meal_id) for meal_id, (battles, wins) in deltas]
+            )
+            conn.commit()
+
+            logger.info("Flushed battle stats for %d meals", len(deltas))
+
+    except sqlite3.Error as e:
+        logger.error("Database error: %s", str(e))
+        raise e
+
+
+@contextmanager
+def batched_stats():
+    """Buffers update_meal_stats calls made in the block and flushes them on exit."""
+    # nested blocks join the outermost one
+    if getattr(_stats_buffer, "pending", None) is not None:
+        yield
+        return
+
+    _stats_buffer.pending = {}
+    try:
+        yield
+        # skipped if the block raises, which discards the buffered stats
+        flush_meal_stats()
+    finally:
+        _stats_buffer.pending = None
@@ -0,0 +1,43 @@
+"""Fixtures shared by the meal_max test modules."""
+import os
+import sqlite3
+
+import pytest
+
+from meal_max.models.kitchen_model import Meal
+
+
+SQL_CREATE_TABLE_PATH = os.path.join(os.path.dirname(__file__), "..", "sql", "create_meal_table.sql")
+
+# Sample meals
+@pytest.fixture(scope="module")
+def meal_1():
+    return Meal(1, 'Meal 1', 'Cuisine 1', 20.0, 'LOW')
+
+@pytest.fixture(scope="module")
+def meal_2():
+    return Meal(2, 'Meal 2', 'Cuisine 2', 15.0, 'HIGH')
+
+@pytest.fixture(scope="module")
+def sample_meals(meal_1, meal_2):
+    return [meal_1, meal_2]
+
+# Shared in-memory database
+@pytest.fixture(scope="session")
+def sql_create_table_path():
+    """Path to the script that (re)creates the meals table."""
+    return SQL_CREATE_TABLE_PATH
+
+@pytest.fixture(scope="session")
+def _db():
+    """One in-memory database with the meals schema, shared by every test."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+    # No-ops on a :memory: database, whose journal is already in memory and
+    # which never fsyncs; kept so a file-backed test database stays fast too
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    with open(SQL_CREATE_TABLE_PATH, "r") as fh:
+        conn.executescript(fh.read())
+    yield conn
+    conn.close()
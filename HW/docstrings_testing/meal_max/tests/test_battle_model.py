@@ -0,0 +1,91 @@
+import pytest
+
+from meal_max.models.battle_model import BattleModel
+
+
+@pytest.fixture(scope="module")
+def battle_model():
+    """Fixture to provide one instance of BattleModel shared by the module."""
+    return BattleModel()
+
+@pytest.fixture(autouse=True)
+def _reset(battle_model):
+    """Start every test with an empty combatants list."""
+    battle_model.combatants = []
+    yield
+
+@pytest.fixture
+def mock_update_meal_stats(mocker):
+    """Mock the update_meal_stats function for testing purposes."""
+    return mocker.patch("meal_max.models.battle_model.update_meal_stats")
+
+@pytest.fixture
+def mock_get_random(mocker):
+    """Mock the get_random function so battles do not call random.org."""
+    return mocker.patch("meal_max.models.battle_model.get_random")
+
+
+##################################################
+# Combatant Management Test Cases
+##################################################
+
+def test_prep_combatant(battle_model, meal_1):
+    """Test adding a combatant to the combatants list."""
+    battle_model.prep_combatant(meal_1)
+    assert len(battle_model.combatants) == 1
+    assert battle_model.combatants[0].meal == 'Meal 1'
+
+def test_prep_combatant_full(battle_model, sample_meals, meal_1):
+    """Test error when adding a combatant to a full combatants list."""
+    battle_model.combatants.extend(sample_meals)
+    with pytest.raises(ValueError, match="Combatant list is full, cannot add more combatants."):
+        battle_model.prep_combatant(meal_1)
+
+def test_get_combatants(battle_model, sample_meals):
+    """Test retrieving the current list of combatants."""
+    battle_model.combatants.extend(sample_meals)
+    assert battle_model.get_combatants() == sample_meals
+
+@pytest.mark.parametrize("num_combatants", [0, 1, 2])
+def test_clear_combatants(battle_model, sample_meals, num_combatants):
+    """Test clearing an empty, singular and full combatants list."""
+    battle_model.combatants.extend(sample_meals[:num_combatants])
+    battle_model.clear_combatants()
+    assert len(battle_model.combatants) == 0, "Combatants list should be empty after clearing"
+
+##################################################
+# Battle Score Test Cases
+##################################################
+
+def test_get_battle_score(battle_model, meal_1, meal_2):
+    """Test the battle score for each difficulty modifier."""
+    assert battle_model.get_battle_score(meal_1) == 20.0 * 9 - 3
+    assert battle_model.get_battle_score(meal_2) == 15.0 * 9 - 1
+
+##################################################
+# Battle Test Cases
+##################################################
+
+@pytest.mark.parametrize("scores,rand,winner_idx,loser_idx", [
+    ([90, 85], 0.02, 0, 1),
+    ([85, 90], 0.05, 1, 0)
+])
+def test_battle(battle_model, sample_meals, mocker, mock_get_random, mock_update_meal_stats, scores, rand, winner_idx, loser_idx):
+    """Test the first combatant winning only when the score delta beats the random number."""
+    battle_model.combatants.extend(sample_meals)
+    mocker.patch.object(BattleModel, "get_battle_score", side_effect=scores)
+    mock_get_random.return_value = rand
+    winner, loser = sample_meals[winner_idx], sample_meals[loser_idx]
+
+    result = battle_model.battle()
+
+    assert result == winner.meal
+    assert battle_model.combatants == [winner], "Loser should be removed from the combatants list"
+    mock_update_meal_stats.assert_any_call(winner.id, 'win')
+    mock_update_meal_stats.assert_any_call(loser.id, 'loss')
+
+def test_battle_not_enough_combatants(battle_model, meal_1):
+    """Test error when starting a battle with fewer than two combatants."""
+    battle_model.prep_combatant(meal_1)
+    with pytest.raises(ValueError, match="Two combatants must be prepped for a battle."):
+        battle_model.battle()
@@ -0,0 +1,329 @@
+from contextlib import contextmanager, nullcontext
+import sqlite3
+
+import pytest
+
+from meal_max.models import kitchen_model
+from meal_max.models.kitchen_model import (
+    Meal,
+    batched_stats,
+    create_meal,
+    clear_meal_cache,
+    clear_meals,
+    delete_meal,
+    get_leaderboard,
+    get_meal_by_id,
+    get_meal_by_name,
+    update_meal_stats
+)
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+class _SavepointConnection:
+    """Wraps the shared connection so the model's commits stay inside the test savepoint."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def cursor(self) -> sqlite3.Cursor:
+        return self._conn.cursor()
+
+    def commit(self) -> None:
+        pass
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_db_connection(_db, module_mocker):
+    """Point get_db_connection at the shared database for this module."""
+    @contextmanager
+    def mock_get_db_connection():
+        yield _SavepointConnection(_db)
+
+    module_mocker.patch("meal_max.models.kitchen_model.get_db_connection", mock_get_db_connection)
+
+@pytest.fixture
+def mock_db_cursor(_db):
+    """Run each test inside a savepoint that is rolled back afterwards."""
+    _db.execute("SAVEPOINT t")
+    yield _db.cursor()
+    _db.execute("ROLLBACK TO t")
+    _db.execute("RELEASE t")
+    # Cached lookups would otherwise outlive the rolled back rows
+    clear_meal_cache()
+
+def insert_meal(cursor, meal, cuisine="Italian", price=10.0, difficulty="LOW", battles=0, wins=0, deleted=False) -> int:
+    cursor.execute("""
+        INSERT INTO meals (meal, cuisine, price, difficulty, battles, wins, deleted)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (meal, cuisine, price, difficulty, battles, wins, deleted))
+    return cursor.lastrowid
+
+######################################################
+#
+#    Meal
+#
+######################################################
+
+def test_meal_post_init_invalid_price():
+    """Test error when constructing a meal with a negative price."""
+    with pytest.raises(ValueError, match="Price must be a positive value."):
+        Meal(1, "Meal Name", "Cuisine", -10.0, "LOW")
+
+def test_meal_post_init_invalid_difficulty():
+    """Test error when constructing a meal with an unknown difficulty."""
+    with pytest.raises(ValueError, match="Difficulty must be 'LOW', 'MED', or 'HIGH'."):
+        Meal(1, "Meal Name", "Cuisine", 10.0, "EXTREME")
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+def test_create_meal(mock_db_cursor):
+    """Test creating a new meal in the database."""
+    create_meal(meal="Meal Name", cuisine="Cuisine Type", price=15.0, difficulty="MED")
+
+    mock_db_cursor.execute("SELECT meal, cuisine, price, difficulty, battles, wins, deleted FROM meals")
+    rows = mock_db_cursor.fetchall()
+
+    expected_rows = [("Meal Name", "Cuisine Type", 15.0, "MED", 0, 0, 0)]
+    assert rows == expected_rows, f"Expected {expected_rows}, got {rows}"
+
+def test_create_meal_duplicate(mock_db_cursor):
+    """Test creating a meal with a duplicate name (should raise an error)."""
+    insert_meal(mock_db_cursor, "Meal Name")
+
+    with pytest.raises(ValueError, match="Meal with name 'Meal Name' already exists"):
+        create_meal(meal="Meal Name", cuisine="Cuisine Type", price=15.0, difficulty="MED")
+
+def test_create_meal_invalid_price():
+    """Test error when trying to create a meal with an invalid price."""
+    with pytest.raises(ValueError, match="Invalid price: -15.0. Price must be a positive number."):
+        create_meal(meal="Meal Name", cuisine="Cuisine Type", price=-15.0, difficulty="MED")
+
+    with pytest.raises(ValueError, match="Invalid price: invalid. Price must be a positive number."):
+        create_meal(meal="Meal Name", cuisine="Cuisine Type", price="invalid", difficulty="MED")
+
+def test_create_meal_invalid_difficulty():
+    """Test error when trying to create a meal with an invalid difficulty."""
+    with pytest.raises(ValueError, match="Invalid difficulty level: EXTREME. Must be 'LOW', 'MED', or 'HIGH'."):
+        create_meal(meal="Meal Name", cuisine="Cuisine Type", price=15.0, difficulty="EXTREME")
+
+def test_delete_meal(mock_db_cursor):
+    """Test soft deleting a meal by meal ID."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name")
+
+    delete_meal(meal_id)
+
+    mock_db_cursor.execute("SELECT deleted FROM meals WHERE id = ?", (meal_id,))
+    assert mock_db_cursor.fetchone()[0], "Expected the meal to be marked as deleted."
+
+def test_delete_meal_bad_id(mock_db_cursor):
+    """Test error when trying to delete a non-existent meal."""
+    with pytest.raises(ValueError, match="Meal with ID 999 not found"):
+        delete_meal(999)
+
+def test_delete_meal_already_deleted(mock_db_cursor):
+    """Test error when trying to delete a meal that's already marked as deleted."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", deleted=True)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_id} has been deleted"):
+        delete_meal(meal_id)
+
+def test_clear_meals(mocker, sql_create_table_path):
+    """Test clearing all meals by recreating the meals table."""
+    # executescript commits any open transaction, so this test uses its own database
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE meals (id INTEGER PRIMARY KEY, meal TEXT)")
+    conn.execute("INSERT INTO meals (meal) VALUES ('Meal Name')")
+
+    @contextmanager
+    def mock_get_db_connection():
+        yield conn
+
+    mocker.patch("meal_max.models.kitchen_model.get_db_connection", mock_get_db_connection)
+    mocker.patch.dict("os.environ", {"SQL_CREATE_TABLE_PATH": sql_create_table_path})
+
+    clear_meals()
+
+    assert conn.execute("SELECT COUNT(*) FROM meals").fetchone()[0] == 0, "Expected the meals table to be empty."
+    conn.close()
+
+######################################################
+#
+#    Get Meal
+#
+######################################################
+
+def test_get_meal_by_id(mock_db_cursor):
+    """Test retrieving a meal by ID."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", "Cuisine Type", 15.0, "MED")
+
+    result = get_meal_by_id(meal_id)
+
+    expected_result = Meal(meal_id, "Meal Name", "Cuisine Type", 15.0, "MED")
+    assert result == expected_result, f"Expected {expected_result}, got {result}"
+
+def test_get_meal_by_id_bad_id(mock_db_cursor):
+    """Test error when the meal ID does not exist."""
+    with pytest.raises(ValueError, match="Meal with ID 999 not found"):
+        get_meal_by_id(999)
+
+def test_get_meal_by_id_deleted(mock_db_cursor):
+    """Test error when the meal has been deleted."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", deleted=True)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_id} has been deleted"):
+        get_meal_by_id(meal_id)
+
+def test_get_meal_by_id_cached_until_deleted(mock_db_cursor):
+    """Test that repeat lookups are served from the cache until the meal is deleted."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", "Cuisine Type", 15.0, "MED")
+    first = get_meal_by_id(meal_id)
+
+    # A direct write bypasses the model, so the cached meal is still returned
+    mock_db_cursor.execute("UPDATE meals SET cuisine = 'Other' WHERE id = ?", (meal_id,))
+    assert get_meal_by_id(meal_id) is first
+
+    delete_meal(meal_id)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_id} has been deleted"):
+        get_meal_by_id(meal_id)
+
+def test_get_meal_by_id_delete_during_lookup(mock_db_cursor, mocker):
+    """Test that a lookup which read the row before a concurrent delete does not cache the stale meal."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", "Cuisine Type", 15.0, "MED")
+    fetch_meal_by_id = kitchen_model._fetch_meal_by_id
+
+    def fetch_then_delete(fetched_id):
+        # The row is read while the meal is live, then another request deletes it
+        meal = fetch_meal_by_id(fetched_id)
+        delete_meal(fetched_id)
+        return meal
+
+    mocker.patch("meal_max.models.kitchen_model._fetch_meal_by_id", side_effect=fetch_then_delete)
+    assert get_meal_by_id(meal_id) == Meal(meal_id, "Meal Name", "Cuisine Type", 15.0, "MED")
+    mocker.stopall()
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_id} has been deleted"):
+        get_meal_by_id(meal_id)
+
+def test_get_meal_by_id_without_cache(mock_db_cursor):
+    """Test that cache=False reads the database instead of the cached meal."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", "Cuisine Type", 15.0, "MED")
+    get_meal_by_id(meal_id)
+
+    mock_db_cursor.execute("UPDATE meals SET cuisine = 'Other' WHERE id = ?", (meal_id,))
+
+    assert get_meal_by_id(meal_id, cache=False).cuisine == "Other"
+    assert get_meal_by_id(meal_id).cuisine == "Cuisine Type"
+
+def test_get_meal_by_name(mock_db_cursor):
+    """Test retrieving a meal by name."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", "Cuisine Type", 15.0, "MED")
+
+    result = get_meal_by_name("Meal Name")
+
+    expected_result = Meal(meal_id, "Meal Name", "Cuisine Type", 15.0, "MED")
+    assert result == expected_result, f"Expected {expected_result}, got {result}"
+
+def test_get_meal_by_name_bad_name(mock_db_cursor):
+    """Test error when the meal name does not exist."""
+    with pytest.raises(ValueError, match="Meal with name Missing Meal not found"):
+        get_meal_by_name("Missing Meal")
+
+def test_get_leaderboard(mock_db_cursor):
+    """Test retrieving the leaderboard sorted by wins."""
+    meal_a_id = insert_meal(mock_db_cursor, "Meal A", "Cuisine A", 10.0, "LOW", battles=4, wins=1)
+    meal_b_id = insert_meal(mock_db_cursor, "Meal B", "Cuisine B", 20.0, "MED", battles=5, wins=3)
+    insert_meal(mock_db_cursor, "Meal C", "Cuisine C", 30.0, "HIGH", battles=0, wins=0)
+    insert_meal(mock_db_cursor, "Meal D", "Cuisine D", 40.0, "HIGH", battles=9, wins=9, deleted=True)
+
+    leaderboard = get_leaderboard()
+
+    expected_result = [
+        {"id": meal_b_id, "meal": "Meal B", "cuisine": "Cuisine B", "price": 20.0, "difficulty": "MED", "battles": 5, "wins": 3, "win_pct": 60.0},
+        {"id": meal_a_id, "meal": "Meal A", "cuisine": "Cuisine A", "price": 10.0, "difficulty": "LOW", "battles": 4, "wins": 1, "win_pct": 25.0}
+    ]
+    assert leaderboard == expected_result, f"Expected {expected_result}, but got {leaderboard}"
+
+def test_get_leaderboard_by_win_pct(mock_db_cursor):
+    """Test retrieving the leaderboard sorted by win percentage."""
+    insert_meal(mock_db_cursor, "Meal A", battles=2, wins=2)
+    insert_meal(mock_db_cursor, "Meal B", battles=9, wins=3)
+
+    leaderboard = get_leaderboard(sort_by="win_pct")
+
+    assert [meal["meal"] for meal in leaderboard] == ["Meal A", "Meal B"]
+    assert [meal["win_pct"] for meal in leaderboard] == [100.0, 33.3]
+
+def test_get_leaderboard_invalid_sort_by():
+    """Test error when sorting the leaderboard by an unknown column."""
+    with pytest.raises(ValueError, match="Invalid sort_by parameter: losses"):
+        get_leaderboard(sort_by="losses")
+
+######################################################
+#
+#    Update stats
+#
+######################################################
+
+@pytest.mark.parametrize("result,expected_wins", [("win", 1), ("loss", 0)])
+def test_update_meal_stats(mock_db_cursor, result, expected_wins):
+    """Test updating battle stats for a meal after a win or a loss."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name")
+
+    update_meal_stats(meal_id, result)
+
+    mock_db_cursor.execute("SELECT battles, wins FROM meals WHERE id = ?", (meal_id,))
+    assert mock_db_cursor.fetchone() == (1, expected_wins)
+
+def test_update_meal_stats_invalid_result(mock_db_cursor):
+    """Test error when the battle result is neither 'win' nor 'loss'."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name")
+
+    with pytest.raises(ValueError, match="Invalid result: draw. Expected 'win' or 'loss'."):
+        update_meal_stats(meal_id, "draw")
+
+def test_update_meal_stats_deleted_meal(mock_db_cursor):
+    """Test error when trying to update stats for a deleted meal."""
+    meal_id = insert_meal(mock_db_cursor, "Meal Name", deleted=True)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_id} has been deleted"):
+        update_meal_stats(meal_id, "win")
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_update_meal_stats_batched(mock_db_cursor, batched):
+    """Test that batched stats end up the same as immediate updates."""
+    meal_a_id = insert_meal(mock_db_cursor, "Meal A")
+    meal_b_id = insert_meal(mock_db_cursor, "Meal B")
+
+    with batched_stats() if batched else nullcontext():
+        update_meal_stats(meal_a_id, "win")
+        update_meal_stats(meal_b_id, "loss")
+        update_meal_stats(meal_a_id, "loss")
+
+        # Nothing is written until the batch is flushed
+        mock_db_cursor.execute("SELECT battles FROM meals WHERE id = ?", (meal_a_id,))
+        assert mock_db_cursor.fetchone() == ((0,) if batched else (2,))
+
+    mock_db_cursor.execute("SELECT id, battles, wins FROM meals ORDER BY id")
+    assert mock_db_cursor.fetchall() == [(meal_a_id, 2, 1), (meal_b_id, 1, 0)]
+
+def test_update_meal_stats_batched_deleted_meal(mock_db_cursor):
+    """Test error on flush when a batched meal has been deleted, with nothing written."""
+    meal_a_id = insert_meal(mock_db_cursor, "Meal A")
+    meal_b_id = insert_meal(mock_db_cursor, "Meal B", deleted=True)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_b_id} has been deleted"):
+        with batched_stats():
+            update_meal_stats(meal_a_id, "win")
+            update_meal_stats(meal_b_id, "loss")
+
+    mock_db_cursor.execute("SELECT battles, wins FROM meals WHERE id = ?", (meal_a_id,))
+    assert mock_db_cursor.fetchone() == (0, 0)
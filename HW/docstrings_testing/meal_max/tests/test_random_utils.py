@@ -0,0 +1,56 @@
+import pytest
+import requests
+import requests_mock
+
+from meal_max.utils.random_utils import get_random
+
+
+RANDOM_NUMBER = 0.77
+RANDOM_ORG_URL = "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new"
+
+@pytest.fixture(scope="module")
+def _random_org_transport():
+    # Module-wide requests-mock transport standing in for random.org
+    with requests_mock.Mocker() as mocker:
+        yield mocker
+
+@pytest.fixture
+def mock_random_org(_random_org_transport):
+    # Forget the requests made by the previous test
+    _random_org_transport.reset_mock()
+    _random_org_transport.get(RANDOM_ORG_URL, text=f"{RANDOM_NUMBER}\n")
+    return _random_org_transport
+
+
+def test_get_random(mock_random_org):
+    """Test retrieving a random number from random.org."""
+    result = get_random()
+
+    # Assert that the result is the mocked random number
+    assert result == RANDOM_NUMBER, f"Expected random number {RANDOM_NUMBER}, but got {result}"
+
+    # Ensure that the correct URL was called
+    assert mock_random_org.call_count == 1
+    assert mock_random_org.last_request.url == RANDOM_ORG_URL
+    assert mock_random_org.last_request.timeout == 5
+
+def test_get_random_request_failure(mock_random_org):
+    """Simulate a request failure."""
+    mock_random_org.get(RANDOM_ORG_URL, exc=requests.exceptions.RequestException("Connection error"))
+
+    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
+        get_random()
+
+def test_get_random_timeout(mock_random_org):
+    """Simulate a timeout."""
+    mock_random_org.get(RANDOM_ORG_URL, exc=requests.exceptions.Timeout)
+
+    with pytest.raises(RuntimeError, match="Request to random.org timed out."):
+        get_random()
+
+def test_get_random_invalid_response(mock_random_org):
+    """Simulate an invalid response (non-digit)."""
+    mock_random_org.get(RANDOM_ORG_URL, text="invalid_response")
+
+    with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
+        get_random()
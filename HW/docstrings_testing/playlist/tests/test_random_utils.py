@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
 import requests
 
@@ -7,14 +10,26 @@ from music_collection.utils.random_utils import get_random
 RANDOM_NUMBER = 42
 NUM_SONGS = 100
 
+@pytest.fixture(scope="module")
+def _requests_get():
+    # Module-wide stand-in for requests.get; tests set its return value or side effect
+    with pytest.MonkeyPatch.context() as mp:
+        mock_get = Mock()
+        mp.setattr(requests, "get", mock_get)
+        yield mock_get
+
+@pytest.fixture
+def mock_requests_get(_requests_get):
+    # Clear calls and the response left over from the previous test
+    _requests_get.reset_mock(return_value=True, side_effect=True)
+    return _requests_get
+
 @pytest.fixture
-def mock_random_org(mocker):
-    # Patch the requests.get call
-    # requests.get returns an object, which we have replaced with a mock object
-    mock_response = mocker.Mock()
-    # We are giving that object a text attribute
-    mock_response.text = f"{RANDOM_NUMBER}"
-    mocker.patch("requests.get", return_value=mock_response)
+def mock_random_org(mock_requests_get):
+    # requests.get returns a response; a plain namespace with the attributes
+    # get_random reads is enough since nothing asserts on it
+    mock_response = SimpleNamespace(status_code=200, text=f"{RANDOM_NUMBER}", raise_for_status=lambda: None)
+    mock_requests_get.return_value = mock_response
     return mock_response
 
 
@@ -28,16 +43,16 @@ def test_get_random(mock_random_org):
     # Ensure that the correct URL was called
     requests.get.assert_called_once_with("https://www.random.org/integers/?num=1&min=1&max=100&col=1&base=10&format=plain&rnd=new", timeout=5)
 
-def test_get_random_request_failure(mocker):
+def test_get_random_request_failure(mock_requests_get):
     """Simulate  a request failure."""
-    mocker.patch("requests.get", side_effect=requests.exceptions.RequestException("Connection error"))
+    mock_requests_get.side_effect = requests.exceptions.RequestException("Connection error")
 
     with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
         get_random(NUM_SONGS)
 
-def test_get_random_timeout(mocker):
+def test_get_random_timeout(mock_requests_get):
     """Simulate  a timeout."""
-    mocker.patch("requests.get", side_effect=requests.exceptions.Timeout)
+    mock_requests_get.side_effect = requests.exceptions.Timeout
 
     with pytest.raises(RuntimeError, match="Request to random.org timed out."):
         get_random(NUM_SONGS)
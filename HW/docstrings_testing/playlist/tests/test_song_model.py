@@ -22,19 +22,41 @@ from music_collection.models.song_model import (
 #
 ######################################################
 
-def normalize_whitespace(sql_query: str) -> str:
-    return re.sub(r'\s+', ' ', sql_query).strip()
+_WS = re.compile(r'\s+')
 
-# Mocking the database connection for tests
-@pytest.fixture
-def mock_cursor(mocker):
-    mock_conn = mocker.Mock()
-    mock_cursor = mocker.Mock()
+def normalize_whitespace(sql_query: str) -> str:
+    return _WS.sub(' ', sql_query).strip()
+
+# Normalized SQL the song model is expected to execute
+_EXPECTED_INSERT = normalize_whitespace("""
+    INSERT INTO songs (artist, title, year, genre, duration)
+    VALUES (?, ?, ?, ?, ?)
+""")
+_EXPECTED_SELECT_DELETED = normalize_whitespace("SELECT deleted FROM songs WHERE id = ?")
+_EXPECTED_SOFT_DELETE = normalize_whitespace("UPDATE songs SET deleted = TRUE WHERE id = ?")
+_EXPECTED_SELECT_BY_ID = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE id = ?")
+_EXPECTED_SELECT_BY_COMPOUND_KEY = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE artist = ? AND title = ? AND year = ?")
+_EXPECTED_SELECT_ALL = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, play_count
+    FROM songs
+    WHERE deleted = FALSE
+""")
+_EXPECTED_SELECT_ALL_BY_PLAY_COUNT = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, play_count
+    FROM songs
+    WHERE deleted = FALSE
+    ORDER BY play_count DESC
+""")
+_EXPECTED_UPDATE_PLAY_COUNT = normalize_whitespace("UPDATE songs SET play_count = play_count + 1 WHERE id = ?")
+
+# Module-wide mock of the database connection
+@pytest.fixture(scope="module")
+def _patched_db_connection(module_mocker):
+    mock_conn = module_mocker.Mock()
+    mock_cursor = module_mocker.Mock()
 
     # Mock the connection's cursor
     mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.fetchone.return_value = None  # Default return for queries
-    mock_cursor.fetchall.return_value = []
     mock_conn.commit.return_value = None
 
     # Mock the get_db_connection context manager from sql_utils
@@ -42,9 +64,18 @@ def mock_cursor(mocker):
     def mock_get_db_connection():
         yield mock_conn  # Yield the mocked connection object
 
-    mocker.patch("music_collection.models.song_model.get_db_connection", mock_get_db_connection)
+    module_mocker.patch("music_collection.models.song_model.get_db_connection", mock_get_db_connection)
+
+    return mock_cursor
+
+@pytest.fixture
+def mock_cursor(_patched_db_connection):
+    # Clear calls and per-test expectations left over from the previous test
+    _patched_db_connection.reset_mock(return_value=True, side_effect=True)
+    _patched_db_connection.fetchone.return_value = None  # Default return for queries
+    _patched_db_connection.fetchall.return_value = []
 
-    return mock_cursor  # Return the mock cursor so we can set expectations per test
+    return _patched_db_connection  # Return the mock cursor so we can set expectations per test
 
 ######################################################
 #
@@ -58,10 +89,7 @@ def test_create_song(mock_cursor):
     # Call the function to create a new song
     create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=180)
 
-    expected_query = normalize_whitespace("""
-        INSERT INTO songs (artist, title, year, genre, duration)
-        VALUES (?, ?, ?, ?, ?)
-    """)
+    expected_query = _EXPECTED_INSERT
 
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
@@ -116,9 +144,9 @@ def test_delete_song(mock_cursor):
     # Call the delete_song function
     delete_song(1)
 
-    # Normalize the SQL for both queries (SELECT and UPDATE)
-    expected_select_sql = normalize_whitespace("SELECT deleted FROM songs WHERE id = ?")
-    expected_update_sql = normalize_whitespace("UPDATE songs SET deleted = TRUE WHERE id = ?")
+    # Expected SQL for both queries (SELECT and UPDATE)
+    expected_select_sql = _EXPECTED_SELECT_DELETED
+    expected_update_sql = _EXPECTED_SOFT_DELETE
 
     # Access both calls to `execute()` using `call_args_list`
     actual_select_sql = normalize_whitespace(mock_cursor.execute.call_args_list[0][0][0])
@@ -195,7 +223,7 @@ def test_get_song_by_id(mock_cursor):
     assert result == expected_result, f"Expected {expected_result}, got {result}"
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE id = ?")
+    expected_query = _EXPECTED_SELECT_BY_ID
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     # Assert that the SQL query was correct
@@ -230,7 +258,7 @@ def test_get_song_by_compound_key(mock_cursor):
     assert result == expected_result, f"Expected {expected_result}, got {result}"
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, deleted FROM songs WHERE artist = ? AND title = ? AND year = ?")
+    expected_query = _EXPECTED_SELECT_BY_COMPOUND_KEY
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     # Assert that the SQL query was correct
@@ -266,11 +294,7 @@ def test_get_all_songs(mock_cursor):
     assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-        WHERE deleted = FALSE
-    """)
+    expected_query = _EXPECTED_SELECT_ALL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -291,7 +315,7 @@ def test_get_all_songs_empty_catalog(mock_cursor, caplog):
     assert "The song catalog is empty." in caplog.text, "Expected warning about empty catalog not found in logs."
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs WHERE deleted = FALSE")
+    expected_query = _EXPECTED_SELECT_ALL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     # Assert that the SQL query was correct
@@ -320,12 +344,7 @@ def test_get_all_songs_ordered_by_play_count(mock_cursor):
     assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-        WHERE deleted = FALSE
-        ORDER BY play_count DESC
-    """)
+    expected_query = _EXPECTED_SELECT_ALL_BY_PLAY_COUNT
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -356,7 +375,7 @@ def test_get_random_song(mock_cursor, mocker):
     mock_random.assert_called_once_with(3)
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs WHERE deleted = FALSE")
+    expected_query = _EXPECTED_SELECT_ALL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     # Assert that the SQL query was correct
@@ -376,7 +395,7 @@ def test_get_random_song_empty_catalog(mock_cursor, mocker):
     mocker.patch("music_collection.models.song_model.get_random").assert_not_called()
 
     # Ensure the SQL query was executed correctly
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs WHERE deleted = FALSE")
+    expected_query = _EXPECTED_SELECT_ALL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     # Assert that the SQL query was correct
@@ -392,10 +411,8 @@ def test_update_play_count(mock_cursor):
     song_id = 1
     update_play_count(song_id)
 
-    # Normalize the expected SQL query
-    expected_query = normalize_whitespace("""
-        UPDATE songs SET play_count = play_count + 1 WHERE id = ?
-    """)
+    # Expected SQL query
+    expected_query = _EXPECTED_UPDATE_PLAY_COUNT
 
     # Ensure the SQL query was executed correctly
     actual_query = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])